@@ -8,6 +8,7 @@ import dotenv
 dotenv.load_dotenv()
 
 import api.routes.security
+from api.cache import connect_cache, dispose_cache
 from api.database import (
     connect_engine,
     dispose_engine
@@ -22,7 +23,9 @@ from api.routes.sources import router as sources_router
 async def setup_engine(a: FastAPI):
     """Return database client instance."""
     await connect_engine()
+    await connect_cache()
     yield
+    await dispose_cache()
     await dispose_engine()
 
 
@@ -52,4 +55,4 @@ app.include_router(ingest_router)
 app.include_router(sources_router)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000, headers=[("Access-Control-Expose-Headers", "X-Total-Count")])
+    uvicorn.run(app, host="0.0.0.0", port=8000, headers=[("Access-Control-Expose-Headers", "X-Total-Count, X-Next-Cursor")])
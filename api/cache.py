@@ -0,0 +1,163 @@
+#
+# Redis response cache
+#
+# Responses are stored as hashes of their encoded parts so they can be replayed
+# without touching the database. Keys can be registered under a tag so a whole
+# family of keys (e.g. every cached page of a list endpoint) is invalidated at once.
+#
+# Caching is disabled when no REDIS_URL is configured
+#
+import logging
+from os import environ
+from typing import Optional
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+CACHE_TTL_SECONDS = 60
+
+# Kept short so a hung redis raises and requests fall through to the database instead of stalling
+CACHE_SOCKET_TIMEOUT_SECONDS = 0.25
+
+log = logging.getLogger(__name__)
+
+redis_client: redis.Redis = None
+
+
+async def connect_cache():
+    global redis_client
+
+    redis_url = environ.get("REDIS_URL", None)
+
+    if not redis_url:
+        log.info("REDIS_URL is not set, response caching is disabled")
+        return
+
+    redis_client = redis.from_url(
+        redis_url,
+        max_connections=20,
+        socket_timeout=CACHE_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=CACHE_SOCKET_TIMEOUT_SECONDS
+    )
+
+
+async def dispose_cache():
+    global redis_client
+
+    if redis_client is not None:
+        await redis_client.aclose()
+        redis_client = None
+
+
+def _tag_key(tag: str) -> str:
+    # Kept in their own namespace so a tag set can never collide with a cached key
+    return f"tag:{tag}"
+
+
+async def get_cached_response(key: str) -> Optional[dict[str, bytes]]:
+    """Returns the cached response parts for the key, or None on a miss"""
+
+    if redis_client is None:
+        return None
+
+    try:
+        cached = await redis_client.hgetall(key)
+    except RedisError as e:
+        log.warning(f"Failed to read cache key ({key}): {e}")
+        return None
+
+    if not cached:
+        return None
+
+    return {k.decode(): v for k, v in cached.items()}
+
+
+async def set_cached_response(
+        key: str,
+        parts: dict[str, bytes | str | int],
+        tag: Optional[str] = None,
+        ttl_seconds: int = CACHE_TTL_SECONDS
+):
+    """Caches the response parts under the key, optionally registering the key under a tag
+
+    The tag set expires along with the most recent key added to it, so it can't outgrow its live keys
+    """
+
+    if redis_client is None:
+        return
+
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=parts)
+            pipe.expire(key, ttl_seconds)
+
+            if tag is not None:
+                pipe.sadd(_tag_key(tag), key)
+                pipe.expire(_tag_key(tag), ttl_seconds)
+
+            await pipe.execute()
+
+    except RedisError as e:
+        log.warning(f"Failed to write cache key ({key}): {e}")
+
+
+async def get_cached_values(keys: list[str]) -> list[Optional[bytes]]:
+    """Returns the cached value for each key in one round-trip, None for misses"""
+
+    if redis_client is None or len(keys) == 0:
+        return [None] * len(keys)
+
+    try:
+        return await redis_client.mget(keys)
+    except RedisError as e:
+        log.warning(f"Failed to read cache keys ({keys}): {e}")
+        return [None] * len(keys)
+
+
+async def set_cached_values(values: dict[str, str], ttl_seconds: int = CACHE_TTL_SECONDS):
+    """Caches each key's value with the same ttl in one round-trip"""
+
+    if redis_client is None or len(values) == 0:
+        return
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.setex(key, ttl_seconds, value)
+
+            await pipe.execute()
+
+    except RedisError as e:
+        log.warning(f"Failed to write cache keys ({[*values.keys()]}): {e}")
+
+
+async def invalidate(*keys: str, tags: tuple[str, ...] = ()):
+    """Deletes the keys and every key registered under the tags"""
+
+    if redis_client is None:
+        return
+
+    try:
+        to_delete = [*keys]
+
+        # Read and drop the tag sets in one transaction, keys tagged afterwards go into a fresh set
+        if len(tags) > 0:
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    pipe.smembers(_tag_key(tag))
+                    pipe.delete(_tag_key(tag))
+
+                results = await pipe.execute()
+
+            for members in results[::2]:
+                to_delete += [*members]
+
+        if len(to_delete) > 0:
+            await redis_client.delete(*to_delete)
+
+    except RedisError as e:
+        log.warning(f"Failed to invalidate cache keys ({keys}, {tags}): {e}")
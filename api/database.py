@@ -7,7 +7,7 @@
 #
 import datetime
 from os import environ
-from typing import Type, List, Literal
+from typing import AsyncGenerator, Type, List, Literal
 
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
@@ -25,6 +25,7 @@ from api.query_parser import QueryParser
 load_dotenv()
 
 engine: AsyncEngine = None
+async_session_maker: async_sessionmaker[AsyncSession] = None
 
 
 def get_engine():
@@ -32,7 +33,7 @@ def get_engine():
 
 
 async def connect_engine() -> AsyncEngine:
-    global engine
+    global engine, async_session_maker
 
     # Check the uri and DB_URL for the database connection string
     # uri is how the Postgres Operator passes, DB_URL is nicer for .env files
@@ -43,7 +44,22 @@ async def connect_engine() -> AsyncEngine:
     if db_url.startswith("postgresql://"):
         db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-    engine = create_async_engine(db_url)
+    engine = create_async_engine(
+        db_url,
+        pool_size=20,
+        max_overflow=10,
+        pool_pre_ping=True,
+        pool_recycle=300,
+        # The QueryParser produces many statement shapes, give them room in the compiled cache
+        query_cache_size=1200,
+        connect_args={
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 1024
+        }
+    )
+
+    # Built once so every request draws from the same pool
+    async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
 
     async with engine.begin() as conn:
         await conn.run_sync(schemas.Base.metadata.create_all)
@@ -58,6 +74,13 @@ def get_async_session(engine: AsyncEngine, **kwargs) -> async_sessionmaker[Async
     return async_sessionmaker(engine, **kwargs)
 
 
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    """FastAPI dependency yielding a session from the shared session maker"""
+
+    async with async_session_maker() as session:
+        yield session
+
+
 async def source_id_to_slug(
         async_engine: AsyncEngine,
         source_id: id
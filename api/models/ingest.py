@@ -2,6 +2,7 @@ import datetime
 from typing import Optional
 from enum import Enum
 
+import msgspec
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from api.schemas import IngestState, IngestProcessTag
@@ -9,16 +10,14 @@ import api.models.source as Sources
 
 
 class Post(BaseModel):
+    model_config = ConfigDict(from_attributes=True, extra="ignore")
+
     state: Optional[IngestState] = None
     comments: Optional[str] = None
     source_id: Optional[int] = None
     access_group_id: Optional[int] = None
     map_id: Optional[str] = None
-    tags: Optional[list[str]] = None
-
-    class Config:
-        orm_mode = True
-        extra = "ignore"
+    tags: list[str] = []
 
 
 class Get(Post):
@@ -40,6 +39,22 @@ class Get(Post):
         return v
 
 
+class GetStruct(msgspec.Struct, kw_only=True):
+    """msgspec mirror of Get, used to encode responses straight from ORM rows without validation"""
+
+    state: Optional[IngestState] = None
+    comments: Optional[str] = None
+    source_id: Optional[int] = None
+    access_group_id: Optional[int] = None
+    map_id: Optional[str] = None
+    tags: list[str] = []
+    id: int
+    object_group_id: int
+    created_on: datetime.datetime
+    completed_on: Optional[datetime.datetime] = None
+    source: Optional[dict] = None
+
+
 class Patch(Post):
     pass
 
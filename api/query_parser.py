@@ -27,9 +27,11 @@ class ParserException(Exception):
 
 
 def get_filter_query_params(request: Request) -> list[tuple[str, str]]:
-    """Returns the query params that are not page or page_size"""
+    """Returns the query params that are not pagination or expand params"""
 
-    return [*filter(lambda x: x[0] not in ["page", "page_size"], request.query_params.multi_items())]
+    return [
+        *filter(lambda x: x[0] not in ["page", "page_size", "after_id", "expand"], request.query_params.multi_items())
+    ]
 
 
 def cast_to_column_type(column: Column, value):
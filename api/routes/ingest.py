@@ -1,27 +1,42 @@
+import asyncio
+import concurrent.futures
+import datetime
+import hashlib
 import os
-from typing import Union
+import urllib.parse
+from functools import lru_cache
+from typing import Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+from fastapi.responses import ORJSONResponse
 import starlette.requests
-from sqlalchemy import insert, select, update, and_, delete, func
+from sqlalchemy import insert, select, update, and_, func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, joinedload, defer
 import minio
 from starlette.responses import Response
 
-from api.database import (
-    get_async_session,
-    get_engine
+from api.cache import (
+    get_cached_response,
+    get_cached_values,
+    set_cached_response,
+    set_cached_values,
+    invalidate
 )
+from api.database import get_session
 from api.routes.security import has_access
 import api.models.ingest as IngestProcessModel
 import api.models.object as Object
+import api.models.source as SourceModel
 import api.schemas as schemas
 from api.schemas import IngestProcess as IngestProcessSchema, ObjectGroup, Sources, IngestProcessTag
 from api.query_parser import get_filter_query_params, QueryParser
+from api.util import MsgspecResponse, PydanticResponse
 
 router = APIRouter(
     prefix="/ingest-process",
     tags=["ingest-process"],
+    default_response_class=ORJSONResponse,
     responses={
         404: {
             "description": "Not found"
@@ -30,228 +45,411 @@ router = APIRouter(
 )
 
 
-@router.get("", response_model=list[IngestProcessModel.Get])
+INGEST_LIST_CACHE_TAG = "v1:ingest:list"
+
+
+def ingest_list_cache_key(
+        page: int,
+        page_size: int,
+        after_id: Optional[int],
+        filter_query_params: list[tuple[str, str]],
+        expand: set[Literal["source"]]
+) -> str:
+    params = urllib.parse.urlencode([*filter_query_params, *[("expand", e) for e in sorted(expand)]])
+    params_hash = hashlib.sha256(params.encode()).hexdigest()
+    return f"{INGEST_LIST_CACHE_TAG}:{page}:{page_size}:{after_id}:{params_hash}"
+
+
+def ingest_get_cache_key(id: int) -> str:
+    return f"v1:ingest:get:{id}"
+
+
+async def invalidate_ingest_process_cache(id: int = None):
+    """Drop every cached list page and, if given, the cached ingest process"""
+
+    keys = [] if id is None else [ingest_get_cache_key(id)]
+    await invalidate(*keys, tags=(INGEST_LIST_CACHE_TAG,))
+
+
+async def invalidate_ingest_source_cache(session: AsyncSession, source_id: int):
+    """Drop every cached list page and each cached ingest process embedding the source"""
+
+    ids = await session.scalars(
+        select(IngestProcessSchema.id).where(IngestProcessSchema.source_id == source_id)
+    )
+    await invalidate(*[ingest_get_cache_key(id) for id in ids], tags=(INGEST_LIST_CACHE_TAG,))
+
+
+PRESIGNED_URL_EXPIRY = datetime.timedelta(days=7)
+
+# Cached urls are dropped well before they expire so clients always get a usable url
+PRESIGNED_URL_CACHE_BUFFER = datetime.timedelta(hours=1)
+
+# Signing is HMAC work, bound how many threads it can take
+_SIGN_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4))
+
+
+@lru_cache
+def get_minio_client(host: str) -> minio.Minio:
+    """Minio client for the host, built once and shared so its bucket region lookups are cached"""
+
+    return minio.Minio(endpoint=host, access_key=os.environ['access_key'],
+                       secret_key=os.environ['secret_key'], secure=True)
+
+
+def presigned_url_cache_key(obj: schemas.Object) -> str:
+    # bucket and key are only unique per host, see the unique_file constraint
+    return f"psu:{obj.host}:{obj.bucket}:{obj.key}"
+
+
+async def get_presigned_urls(objects: list[schemas.Object]) -> list[str]:
+    """Presigned get urls for the objects, signing in the pool only the ones not already cached
+
+    Each object is signed by its own host's client
+    """
+
+    urls = [
+        None if url is None else url.decode()
+        for url in await get_cached_values([presigned_url_cache_key(obj) for obj in objects])
+    ]
+
+    to_sign = [i for i, url in enumerate(urls) if url is None]
+    if len(to_sign) == 0:
+        return urls
+
+    loop = asyncio.get_running_loop()
+    signed_urls = await asyncio.gather(*[
+        loop.run_in_executor(
+            _SIGN_POOL,
+            get_minio_client(objects[i].host).presigned_get_object,
+            objects[i].bucket,
+            objects[i].key,
+            PRESIGNED_URL_EXPIRY
+        )
+        for i in to_sign
+    ])
+
+    for i, url in zip(to_sign, signed_urls):
+        urls[i] = url
+
+    await set_cached_values(
+        {presigned_url_cache_key(objects[i]): url for i, url in zip(to_sign, signed_urls)},
+        ttl_seconds=int((PRESIGNED_URL_EXPIRY - PRESIGNED_URL_CACHE_BUFFER).total_seconds())
+    )
+
+    return urls
+
+
+def ingest_process_to_struct(
+        ingest_process: IngestProcessSchema,
+        include_source: bool = True
+) -> IngestProcessModel.GetStruct:
+    """Build the IngestProcessModel.Get payload directly from the ORM object, skipping model validation
+
+    Leave include_source off when the source relation was not loaded
+    """
+
+    source = ingest_process.source if include_source else None
+
+    return IngestProcessModel.GetStruct(
+        state=ingest_process.state,
+        comments=ingest_process.comments,
+        source_id=ingest_process.source_id,
+        access_group_id=ingest_process.access_group_id,
+        map_id=ingest_process.map_id,
+        tags=[tag.tag for tag in ingest_process.tags],
+        id=ingest_process.id,
+        object_group_id=ingest_process.object_group_id,
+        created_on=ingest_process.created_on,
+        completed_on=ingest_process.completed_on,
+        source=None if source is None else {
+            field: getattr(source, field) for field in SourceModel.Get.model_fields
+        }
+    )
+
+
+@router.get("", responses={200: {"model": list[IngestProcessModel.Get]}})
 async def get_multiple_ingest_process(
-        response: Response,
         page: int = 0,
         page_size: int = 50,
-        filter_query_params=Depends(get_filter_query_params)
+        after_id: Optional[int] = None,
+        filter_query_params=Depends(get_filter_query_params),
+        expand: set[Literal["source"]] = Query(default_factory=set),
+        session: AsyncSession = Depends(get_session)
 ):
-    """Get all ingestion processes"""
+    """Get all ingestion processes, the source relation is only included with `expand=source`
+
+    Without an order_by filter results are ordered by descending id, and the X-Next-Cursor header
+    holds the `after_id` to pass for the next page. Paging with `after_id` seeks from the cursor
+    instead of offsetting by `page`.
+    """
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
+    cache_key = ingest_list_cache_key(page, page_size, after_id, filter_query_params, expand)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        headers = {"X-Total-Count": cached["count"].decode()}
+        if cached["next_cursor"]:
+            headers["X-Next-Cursor"] = cached["next_cursor"].decode()
+
+        return Response(content=cached["body"], media_type="application/json", headers=headers)
 
     query_parser = QueryParser(columns=IngestProcessSchema.__table__.c, query_params=filter_query_params)
+    order_by_columns = query_parser.get_order_by_columns()
+
+    select_stmt = select(IngestProcessSchema) \
+        .limit(page_size) \
+        .where(and_(query_parser.where_expressions())) \
+        .order_by(*order_by_columns, IngestProcessSchema.id.desc()) \
+        .options(selectinload(IngestProcessSchema.tags))
 
-    async with async_session() as session:
+    if after_id is not None:
+        if len(order_by_columns) > 0:
+            raise HTTPException(status_code=400, detail="after_id can not be combined with order_by")
 
-        select_stmt = select(IngestProcessSchema) \
-            .limit(page_size) \
-            .offset(page_size * page) \
-            .where(and_(query_parser.where_expressions())) \
-            .order_by(*query_parser.get_order_by_columns()) \
-            .options(joinedload(IngestProcessSchema.source).defer(Sources.rgeom).defer(Sources.web_geom)) \
-            .options(selectinload(IngestProcessSchema.tags))
+        select_stmt = select_stmt.where(IngestProcessSchema.id < after_id)
 
-        # If there is a filter based on tags
-        if query_parser.decomposed_query_params.get("tags") is not None:
-            query_param = query_parser.decomposed_query_params.get("tags")
-            query_param.column = IngestProcessTag.tag
-            operation_expression = query_param.get_operator_expression()
-            select_stmt = select_stmt.filter(IngestProcessSchema.tags.any(operation_expression))
+    else:
+        select_stmt = select_stmt.offset(page_size * page)
+
+    if "source" in expand:
+        select_stmt = select_stmt.options(
+            selectinload(IngestProcessSchema.source).defer(Sources.rgeom).defer(Sources.web_geom)
+        )
 
-        results = await session.execute(select_stmt)
+    # If there is a filter based on tags
+    if query_parser.decomposed_query_params.get("tags") is not None:
+        query_param = query_parser.decomposed_query_params.get("tags")
+        query_param.column = IngestProcessTag.tag
+        operation_expression = query_param.get_operator_expression()
+        select_stmt = select_stmt.filter(IngestProcessSchema.tags.any(operation_expression))
 
-        response.headers["X-Total-Count"] = str(await session.scalar(select(func.count("*")).select_from(select_stmt.subquery())))
+    results = await session.scalars(select_stmt)
+    ingest_processes = [
+        ingest_process_to_struct(ingest_process, include_source="source" in expand)
+        for ingest_process in results.unique()
+    ]
 
-        return map(lambda x: x[0], results.all())
+    total_count = await session.scalar(select(func.count("*")).select_from(select_stmt.subquery()))
+
+    # The cursor only follows the id ordering, so it is not offered for custom orderings
+    next_cursor = ""
+    if len(order_by_columns) == 0 and len(ingest_processes) == page_size:
+        next_cursor = str(ingest_processes[-1].id)
+
+    headers = {"X-Total-Count": str(total_count)}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+
+    response = await MsgspecResponse.create(ingest_processes, headers=headers)
+    await set_cached_response(
+        cache_key,
+        {"body": response.body, "count": total_count, "next_cursor": next_cursor},
+        tag=INGEST_LIST_CACHE_TAG
+    )
+
+    return response
 
 
 @router.get("/tags", response_model=list[str])
-async def get_all_tags():
+async def get_all_tags(session: AsyncSession = Depends(get_session)):
     """Get all tags"""
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
-
-    async with async_session() as session:
-        select_stmt = select(IngestProcessTag.tag).distinct()
-        results = await session.execute(select_stmt)
+    select_stmt = select(IngestProcessTag.tag).distinct()
+    results = await session.execute(select_stmt)
 
-        return [result[0] for result in results.all()]
+    return [result[0] for result in results.all()]
 
 
-@router.get("/{id}", response_model=IngestProcessModel.Get)
-async def get_ingest_process(id: int):
+@router.get("/{id}", responses={200: {"model": IngestProcessModel.Get}})
+async def get_ingest_process(id: int, session: AsyncSession = Depends(get_session)):
     """Get a single object"""
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
+    cache_key = ingest_get_cache_key(id)
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return Response(content=cached["body"], media_type="application/json")
 
-    async with async_session() as session:
-        select_stmt = select(IngestProcessSchema).where(and_(IngestProcessSchema.id == id)) \
-            .options(joinedload(IngestProcessSchema.source).defer(Sources.rgeom).defer(Sources.web_geom)) \
-            .options(selectinload(IngestProcessSchema.tags))
+    select_stmt = select(IngestProcessSchema).where(and_(IngestProcessSchema.id == id)) \
+        .options(joinedload(IngestProcessSchema.source).defer(Sources.rgeom).defer(Sources.web_geom)) \
+        .options(selectinload(IngestProcessSchema.tags))
 
-        result = await session.scalar(select_stmt)
+    result = await session.scalar(select_stmt)
 
-        if result is None:
-            raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
 
-        return result
+    response = MsgspecResponse(ingest_process_to_struct(result))
+    await set_cached_response(cache_key, {"body": response.body})
+
+    return response
 
 
 @router.post("", response_model=IngestProcessModel.Get)
-async def create_ingest_process(object: IngestProcessModel.Post, user_has_access: bool = Depends(has_access)):
+async def create_ingest_process(
+        object: IngestProcessModel.Post,
+        user_has_access: bool = Depends(has_access),
+        session: AsyncSession = Depends(get_session)
+):
     """Create/Register a new object"""
 
     if not user_has_access:
         raise HTTPException(status_code=403, detail="User does not have access to create an object")
 
-    engine = get_engine()
-    async_session = get_async_session(engine, expire_on_commit=False)
-
-    async with async_session() as session:
-
-        object_group = ObjectGroup()
-        session.add(object_group)
-        await session.commit()
+    # Fetch the source up front so it isn't an extra round-trip after the insert
+    source = None
+    if object.source_id is not None:
+        source = await session.get(
+            Sources, object.source_id, options=[defer(Sources.rgeom), defer(Sources.web_geom)]
+        )
 
-        if object.tags is None:
-            object.tags = []
+    # Flush for the object group id so both inserts share one transaction
+    object_group = ObjectGroup()
+    session.add(object_group)
+    await session.flush()
 
-        tags = [IngestProcessTag(tag=tag.strip()) for tag in object.tags]
-        del object.tags
+    ingest_process = IngestProcessSchema(
+        state=object.state,
+        comments=object.comments,
+        source_id=object.source_id,
+        access_group_id=object.access_group_id,
+        map_id=object.map_id,
+        object_group_id=object_group.id,
+        tags=[IngestProcessTag(tag=tag.strip()) for tag in object.tags]
+    )
 
-        ingest_process = IngestProcessSchema(
-            **object.model_dump(),
-            object_group_id=object_group.id,
-            tags=tags
-        )
+    # The unit of work batches the tag rows into a single executemany on commit
+    session.add(ingest_process)
+    await session.commit()
 
-        session.add(ingest_process)
-        await session.commit()
+    ingest_process.source = source
 
-        ingest_process.source = await session.get(Sources, object.source_id)
+    await invalidate_ingest_process_cache()
 
     return ingest_process
 
 
-@router.patch("/{id}", response_model=IngestProcessModel.Get)
+@router.patch("/{id}", responses={200: {"model": IngestProcessModel.Get}})
 async def patch_ingest_process(
         id: int,
         object: IngestProcessModel.Patch,
-        user_has_access: bool = Depends(has_access)
+        user_has_access: bool = Depends(has_access),
+        session: AsyncSession = Depends(get_session)
 ):
     """Update a object"""
 
     if not user_has_access:
         raise HTTPException(status_code=403, detail="User does not have access to create an object")
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
+    update_stmt = update(IngestProcessSchema) \
+        .where(IngestProcessSchema.id == id) \
+        .values(**object.model_dump(exclude_unset=True)) \
+        .returning(
+            IngestProcessSchema.id,
+            IngestProcessSchema.state,
+            IngestProcessSchema.comments,
+            IngestProcessSchema.source_id,
+            IngestProcessSchema.access_group_id,
+            IngestProcessSchema.map_id,
+            IngestProcessSchema.object_group_id,
+            IngestProcessSchema.created_on,
+            IngestProcessSchema.completed_on
+        ) \
+        .execution_options(synchronize_session=False)
 
-    async with async_session() as session:
-        update_stmt = update(IngestProcessSchema) \
-            .where(IngestProcessSchema.id == id) \
-            .values(**object.model_dump(exclude_unset=True)) \
-            .returning(IngestProcessSchema)
+    row = (await session.execute(update_stmt)).one_or_none()
 
-        server_object = await session.scalar(update_stmt)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
 
-        response = IngestProcessModel.Get(**server_object.__dict__)
-        await session.commit()
-        return response
+    tags = await session.scalars(
+        select(IngestProcessTag.tag).where(IngestProcessTag.ingest_process_id == id)
+    )
+
+    # The row was validated on the way in, so skip revalidating it on the way out
+    response = IngestProcessModel.Get.model_construct(**row._mapping, tags=[*tags])
+    await session.commit()
+    await invalidate_ingest_process_cache(id)
+
+    return PydanticResponse(response)
 
 
 @router.post("/{id}/tags", response_model=list[str])
 async def add_ingest_process_tag(
         id: int,
         tag: IngestProcessModel.Tag,
-        user_has_access: bool = Depends(has_access)
+        user_has_access: bool = Depends(has_access),
+        session: AsyncSession = Depends(get_session)
 ):
     """Add a tag to an ingest process"""
 
     if not user_has_access:
         raise HTTPException(status_code=403, detail="User does not have access to create an object")
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
+    ingest_process = await session.get(IngestProcessSchema, id)
 
-    async with async_session() as session:
+    if ingest_process is None:
+        raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
 
-        ingest_process = await session.get(IngestProcessSchema, id)
+    ingest_process.tags.append(IngestProcessTag(tag=tag.tag.strip()))
+    await session.commit()
+    await invalidate_ingest_process_cache(id)
 
-        if ingest_process is None:
-            raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
-
-        ingest_process.tags.append(IngestProcessTag(tag=tag.tag.strip()))
-        await session.commit()
-
-        ingest_process = await session.get(IngestProcessSchema, id)
-        return [tag.tag for tag in ingest_process.tags]
-
-    return None
+    return [tag.tag for tag in ingest_process.tags]
 
 
 @router.delete("/{id}/tags/{tag}", response_model=list[str])
-async def delete_ingest_process_tag(id: int, tag: str, user_has_access: bool = Depends(has_access)):
+async def delete_ingest_process_tag(
+        id: int,
+        tag: str,
+        user_has_access: bool = Depends(has_access),
+        session: AsyncSession = Depends(get_session)
+):
     """Delete a tag from an ingest process"""
 
     if not user_has_access:
         raise HTTPException(status_code=403, detail="User does not have access to create an object")
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
-
-    async with async_session() as session:
-
-        ingest_process = await session.get(IngestProcessSchema, id)
-
-        if ingest_process is None:
-            raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
+    ingest_process = await session.get(IngestProcessSchema, id)
 
-        tag_stmt = delete(IngestProcessTag).where(
-            and_(IngestProcessTag.ingest_process_id == id, IngestProcessTag.tag == tag))
-        await session.execute(tag_stmt)
-        await session.commit()
-
-        ingest_process = await session.get(IngestProcessSchema, id)
+    if ingest_process is None:
+        raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
 
-        return [tag.tag for tag in ingest_process.tags]
+    # Removed tags are orphaned and deleted by the relationship cascade
+    ingest_process.tags = [t for t in ingest_process.tags if t.tag != tag]
+    await session.commit()
+    await invalidate_ingest_process_cache(id)
 
-    return ingest_process
+    return [tag.tag for tag in ingest_process.tags]
 
 
 @router.get("/{id}/objects", response_model=list[Object.GetSecureURL])
-async def get_ingest_process_objects(id: int):
+async def get_ingest_process_objects(id: int, session: AsyncSession = Depends(get_session)):
     """Get all objects for an ingestion process"""
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
-
-    async with async_session() as session:
+    # Count the objects first so the common empty group costs a single query
+    count_stmt = select(IngestProcessSchema.object_group_id, func.count(schemas.Object.id)) \
+        .outerjoin(schemas.Object, schemas.Object.object_group_id == IngestProcessSchema.object_group_id) \
+        .where(IngestProcessSchema.id == id) \
+        .group_by(IngestProcessSchema.object_group_id)
+    count_row = (await session.execute(count_stmt)).one_or_none()
 
-        select_stmt = select(IngestProcessSchema).where(and_(IngestProcessSchema.id == id))
-        ingest_process = await session.scalar(select_stmt)
+    if count_row is None:
+        raise HTTPException(status_code=404, detail=f"IngestProcess with id ({id}) not found")
 
-        object_stmt = select(ObjectGroup).where(ObjectGroup.id == ingest_process.object_group_id).options(
-            selectinload(ObjectGroup.objects))
-        objects_iterator = await session.execute(object_stmt)
-        schema_objects = objects_iterator.scalar().objects
+    object_group_id, object_count = count_row
 
-    if len(schema_objects) == 0:
+    if object_count == 0:
         return []
 
+    object_stmt = select(schemas.Object).where(schemas.Object.object_group_id == object_group_id)
+    schema_objects = (await session.scalars(object_stmt)).all()
+
     try:
         # Attach the secure url
-        first_object = schema_objects[0]
-        m = minio.Minio(endpoint=first_object.host, access_key=os.environ['access_key'],
-                        secret_key=os.environ['secret_key'], secure=True)
+        pre_signed_urls = await get_presigned_urls(schema_objects)
 
-        for obj in schema_objects:
-            obj.pre_signed_url = m.presigned_get_object(bucket_name=obj.bucket, object_name=obj.key)
+        for obj, pre_signed_url in zip(schema_objects, pre_signed_urls):
+            obj.pre_signed_url = pre_signed_url
 
         return schema_objects
 
@@ -266,57 +464,52 @@ async def create_object(
         request: starlette.requests.Request,
         id: int,
         object: list[UploadFile],
-        user_has_access: bool = Depends(has_access)
+        user_has_access: bool = Depends(has_access),
+        session: AsyncSession = Depends(get_session)
 ):
     """Create/Register a new object"""
 
     if not user_has_access:
         raise HTTPException(status_code=403, detail="User does not have access to create object")
 
-    engine = get_engine()
-    async_session = get_async_session(engine)
-
     response_objects = []
 
-    async with async_session() as session:
+    ingest_stmt = select(IngestProcessSchema).where(IngestProcessSchema.id == id)
+    ingest_process = await session.scalar(ingest_stmt)
 
-        ingest_stmt = select(IngestProcessSchema).where(IngestProcessSchema.id == id)
-        ingest_process = await session.scalar(ingest_stmt)
+    if "multipart/form-data" in request.headers['content-type']:
 
-        if "multipart/form-data" in request.headers['content-type']:
+        files = (await request.form()).getlist("object")
+        for upload_file in files:
 
-            files = (await request.form()).getlist("object")
-            for upload_file in files:
+            m = get_minio_client(os.environ['S3_HOST'])
 
-                m = minio.Minio(endpoint=os.environ['S3_HOST'], access_key=os.environ['access_key'],
-                                secret_key=os.environ['secret_key'], secure=True)
+            object_file_name = f"{ingest_process.id}/{upload_file.filename}"
 
-                object_file_name = f"{ingest_process.id}/{upload_file.filename}"
+            m.put_object(
+                bucket_name=os.environ['S3_BUCKET'],
+                object_name=object_file_name,
+                data=upload_file.file,
+                content_type=upload_file.content_type,
+                length=upload_file.size
+            )
 
-                m.put_object(
-                    bucket_name=os.environ['S3_BUCKET'],
-                    object_name=object_file_name,
-                    data=upload_file.file,
-                    content_type=upload_file.content_type,
-                    length=upload_file.size
-                )
+            object = Object.Post(
+                mime_type=upload_file.content_type,
+                key=object_file_name,
+                bucket=os.environ['S3_BUCKET'],
+                host=os.environ['S3_HOST'],
+                scheme=schemas.SchemeEnum.s3,
+                object_group_id=ingest_process.object_group_id
+            )
 
-                object = Object.Post(
-                    mime_type=upload_file.content_type,
-                    key=object_file_name,
-                    bucket=os.environ['S3_BUCKET'],
-                    host=os.environ['S3_HOST'],
-                    scheme=schemas.SchemeEnum.s3,
-                    object_group_id=ingest_process.object_group_id
-                )
+            insert_stmt = insert(schemas.Object) \
+                .values(**object.model_dump()) \
+                .returning(schemas.Object)
+            server_object = await session.scalar(insert_stmt)
 
-                insert_stmt = insert(schemas.Object) \
-                    .values(**object.model_dump()) \
-                    .returning(schemas.Object)
-                server_object = await session.scalar(insert_stmt)
+            response_objects.append(Object.Get(**server_object.__dict__))
 
-                response_objects.append(Object.Get(**server_object.__dict__))
-
-            await session.commit()
+        await session.commit()
 
     return response_objects
@@ -26,6 +26,7 @@ from api.models.geometries import (
 )
 import api.models.source as Sources
 from api.query_parser import ParserException
+from api.routes.ingest import invalidate_ingest_source_cache
 from api.routes.security import has_access
 
 import api.schemas as schemas
@@ -102,6 +103,10 @@ async def patch_source(source_id: int, source: Sources.Patch, user_has_access: b
 
         response = Sources.Get(**server_object.__dict__)
         await session.commit()
+
+        # Ingest processes embed their source, so their cached responses are now stale
+        await invalidate_ingest_source_cache(session, source_id)
+
         return response
 
 
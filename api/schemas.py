@@ -190,7 +190,9 @@ class IngestProcess(Base):
     # Relationships
     object_group: Mapped[ObjectGroup] = relationship(back_populates="ingest_process", lazy="joined")
     source: Mapped[Sources] = relationship(back_populates="ingest_process")
-    tags: Mapped[List["IngestProcessTag"]] = relationship(back_populates="ingest_process", lazy="joined")
+    tags: Mapped[List["IngestProcessTag"]] = relationship(
+        back_populates="ingest_process", lazy="joined", cascade="all, delete-orphan"
+    )
 
 
 class IngestProcessTag(Base):
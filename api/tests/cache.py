@@ -0,0 +1,99 @@
+import fakeredis
+import pytest
+
+import api.cache as cache
+import api.schemas as schemas
+from api.routes.ingest import (
+    INGEST_LIST_CACHE_TAG, ingest_get_cache_key, ingest_list_cache_key, presigned_url_cache_key
+)
+
+
+@pytest.fixture
+async def redis_client():
+    cache.redis_client = fakeredis.FakeAsyncRedis()
+    yield cache.redis_client
+    await cache.dispose_cache()
+
+
+class TestCache:
+
+    async def test_get_miss(self, redis_client):
+        assert await cache.get_cached_response("test:missing") is None
+
+    async def test_set_get(self, redis_client):
+        await cache.set_cached_response("test:key", {"body": b"[1]", "count": 1})
+
+        assert await cache.get_cached_response("test:key") == {"body": b"[1]", "count": b"1"}
+
+    async def test_set_expires_key_and_tag(self, redis_client):
+        await cache.set_cached_response("test:key", {"body": b"[]"}, tag="test", ttl_seconds=30)
+
+        assert 0 < await redis_client.ttl("test:key") <= 30
+        assert 0 < await redis_client.ttl(cache._tag_key("test")) <= 30
+
+    async def test_invalidate_keys(self, redis_client):
+        await cache.set_cached_response("test:key", {"body": b"[]"})
+        await cache.set_cached_response("test:other", {"body": b"[]"})
+
+        await cache.invalidate("test:key")
+
+        assert await cache.get_cached_response("test:key") is None
+        assert await cache.get_cached_response("test:other") is not None
+
+    async def test_invalidate_tag(self, redis_client):
+        await cache.set_cached_response("test:0", {"body": b"[]"}, tag="test")
+        await cache.set_cached_response("test:1", {"body": b"[]"}, tag="test")
+        await cache.set_cached_response("other:0", {"body": b"[]"}, tag="other")
+
+        await cache.invalidate(tags=("test",))
+
+        assert await cache.get_cached_response("test:0") is None
+        assert await cache.get_cached_response("test:1") is None
+        assert not await redis_client.exists(cache._tag_key("test"))
+        assert await cache.get_cached_response("other:0") is not None
+
+    async def test_values(self, redis_client):
+        await cache.set_cached_values({"test:a": "a"}, ttl_seconds=30)
+
+        assert await cache.get_cached_values(["test:a", "test:b"]) == [b"a", None]
+        assert 0 < await redis_client.ttl("test:a") <= 30
+
+    async def test_disabled(self):
+        cache.redis_client = None
+
+        await cache.set_cached_response("test:key", {"body": b"[]"}, tag="test")
+        await cache.set_cached_values({"test:a": "a"})
+        await cache.invalidate("test:key", tags=("test",))
+
+        assert await cache.get_cached_response("test:key") is None
+        assert await cache.get_cached_values(["test:a"]) == [None]
+
+
+class TestIngestCacheKeys:
+
+    def test_list_key_is_stable(self):
+        assert ingest_list_cache_key(0, 50, None, [("state", "eq.pending")], set()) == \
+               ingest_list_cache_key(0, 50, None, [("state", "eq.pending")], set())
+
+    def test_list_key_varies(self):
+        key = ingest_list_cache_key(0, 50, None, [], set())
+
+        assert key != ingest_list_cache_key(1, 50, None, [], set())
+        assert key != ingest_list_cache_key(0, 10, None, [], set())
+        assert key != ingest_list_cache_key(0, 50, 5, [], set())
+        assert key != ingest_list_cache_key(0, 50, None, [("state", "eq.pending")], set())
+        assert key != ingest_list_cache_key(0, 50, None, [], {"source"})
+
+    def test_get_key(self):
+        assert ingest_get_cache_key(5) != ingest_get_cache_key(6)
+
+    def test_keys_do_not_collide_with_tag_sets(self):
+        assert cache._tag_key(INGEST_LIST_CACHE_TAG) != ingest_list_cache_key(0, 50, None, [], set())
+        assert not ingest_get_cache_key(5).startswith("tag:")
+        assert not ingest_list_cache_key(0, 50, None, [], set()).startswith("tag:")
+
+    def test_presigned_url_key_varies_by_host(self):
+        obj = schemas.Object(scheme="s3", host="a.example.com", bucket="bucket", key="key")
+        other = schemas.Object(scheme="s3", host="b.example.com", bucket="bucket", key="key")
+
+        assert presigned_url_cache_key(obj) != presigned_url_cache_key(other)
@@ -1,6 +1,6 @@
 import random
 
-from .main import api_client
+from .main import api_client, TEST_SOURCE_TABLE
 
 
 class TestIngestProcess:
@@ -57,6 +57,59 @@ class TestIngestProcess:
 
         assert len(data) > 0
 
+    def test_get_ingest_processes_expand_source(self, api_client):
+        """Test that the list only includes the source when expanded"""
+
+        response = api_client.post("/ingest-process", json={
+            "comments": "This is a test comment",
+            "state": "pending",
+            "source_id": TEST_SOURCE_TABLE.source_id
+        })
+        assert response.status_code == 200
+
+        ingest_id = response.json()['id']
+
+        response = api_client.get(f"/ingest-process?id=eq.{ingest_id}")
+        assert response.status_code == 200
+
+        data = response.json()
+
+        assert len(data) == 1
+        assert data[0]['source'] is None
+
+        response = api_client.get(f"/ingest-process?id=eq.{ingest_id}&expand=source")
+        assert response.status_code == 200
+
+        data = response.json()
+
+        assert len(data) == 1
+        assert data[0]['source']['source_id'] == TEST_SOURCE_TABLE.source_id
+
+        response = api_client.get(f"/ingest-process/{ingest_id}")
+        assert response.status_code == 200
+
+        assert response.json()['source']['source_id'] == TEST_SOURCE_TABLE.source_id
+
+    def test_get_ingest_processes_invalid_expand(self, api_client):
+        response = api_client.get("/ingest-process?expand=keys")
+        assert response.status_code == 422
+
+    def test_get_ingest_processes_after_id(self, api_client):
+        response = api_client.get("/ingest-process?page_size=1")
+        assert response.status_code == 200
+
+        data = response.json()
+        next_cursor = response.headers["X-Next-Cursor"]
+
+        assert next_cursor == str(data[0]['id'])
+
+        response = api_client.get(f"/ingest-process?page_size=1&after_id={next_cursor}")
+        assert response.status_code == 200
+
+        next_data = response.json()
+
+        assert all(d['id'] < data[0]['id'] for d in next_data)
+
     def test_get_ingest_process_tags(self, api_client):
         """Test getting tags for an ingest process"""
 
@@ -66,7 +119,7 @@ class TestIngestProcess:
         assert len(data) > 0
 
     def test_get_ingest_process(self, api_client):
-        response = api_client.get("/ingest-process")
+        response = api_client.get("/ingest-process?expand=source")
         assert response.status_code == 200
 
         data = response.json()
@@ -98,6 +151,7 @@ class TestIngestProcess:
         single_data = response.json()
 
         assert single_data['comments'] == "test"
+        assert sorted(single_data['tags']) == sorted(data[0]['tags'])
 
     def test_add_tag_to_ingest_process(self, api_client):
         """Test adding a tag to an ingest process"""
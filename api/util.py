@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any
+
+import msgspec
+from pydantic import BaseModel
+from starlette.responses import Response
+
+
+class MsgspecResponse(Response):
+    """JSON response for msgspec Structs, encoded with msgspec.json
+
+    Use `await MsgspecResponse.create(content)` to encode payloads large enough to stall the loop
+    in a worker thread
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return msgspec.json.encode(content)
+
+    @classmethod
+    async def create(cls, content: Any, **kwargs) -> "MsgspecResponse":
+        body = await asyncio.to_thread(msgspec.json.encode, content)
+        return cls(content=body, **kwargs)
+
+
+class PydanticResponse(Response):
+    """Response that serializes a pydantic model with its own model_dump_json"""
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode("utf-8")